@@ -1,11 +1,20 @@
-from fastapi import FastAPI, Request, status
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from src.api import contacts, groups, utils, auth, users
-from slowapi.errors import RateLimitExceeded
-from src.conf import messages
+from src.services.rate_limiter import RateLimiterMiddleware
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+
+app.add_middleware(
+    RateLimiterMiddleware,
+    rules={"/api/users/me": {"limit": 10, "period": 60}},
+)
+
+# minimum_size skips the small {"message": ...} responses, level 5 balances
+# CPU cost against compression ratio on the contact/group list payloads
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 app.add_middleware(
     CORSMiddleware,
@@ -15,15 +24,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-
-@app.exception_handler(RateLimitExceeded)
-async def rate_limi_handler(request: Request, exc: RateLimitExceeded):
-    return JSONResponse(
-        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-        content={"error": messages.EXCEED_REQUESTS_LIMIT},
-    )
-
-
 app.include_router(contacts.router, prefix="/api")
 app.include_router(groups.router, prefix="/api")
 app.include_router(utils.router, prefix="/api")
@@ -33,4 +33,11 @@ app.include_router(users.router, prefix="/api")
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        reload=True,
+    )
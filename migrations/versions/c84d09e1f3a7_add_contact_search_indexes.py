@@ -0,0 +1,42 @@
+"""Add full-text and trigram search indexes on contact
+
+Revision ID: c84d09e1f3a7
+Revises: b3f1c7a2d954
+Create Date: 2026-08-30 14:02:51.730416
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c84d09e1f3a7'
+down_revision: Union[str, None] = 'b3f1c7a2d954'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_contact_search_tsv ON contact USING gin "
+        "(to_tsvector('simple', name || ' ' || surname || ' ' || email))"
+    )
+    op.execute(
+        "CREATE INDEX ix_contact_name_trgm ON contact USING gin (name gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_contact_surname_trgm ON contact USING gin (surname gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_contact_email_trgm ON contact USING gin (email gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contact_email_trgm', table_name='contact')
+    op.drop_index('ix_contact_surname_trgm', table_name='contact')
+    op.drop_index('ix_contact_name_trgm', table_name='contact')
+    op.drop_index('ix_contact_search_tsv', table_name='contact')
@@ -0,0 +1,29 @@
+"""Add month-day expression index for birthday lookups
+
+Revision ID: d1e5b8a40c26
+Revises: c84d09e1f3a7
+Create Date: 2026-08-30 14:27:33.918204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1e5b8a40c26'
+down_revision: Union[str, None] = 'c84d09e1f3a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX ix_contact_birthday_md ON contact "
+        "((EXTRACT(month FROM birthday) * 100 + EXTRACT(day FROM birthday)))"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contact_birthday_md', table_name='contact')
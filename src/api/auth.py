@@ -5,9 +5,10 @@ from src.services.email import send_email
 from src.schemas import TokenRefreshRequest, UserCreate, Token, UserBase, RequestEmail
 from src.services.auth import (
     create_access_token,
-    Hash,
     create_refresh_token,
     get_email_from_token,
+    hash_handler,
+    invalidate_user_cache,
     verify_refresh_token,
 )
 from src.services.users import UserService
@@ -38,21 +39,16 @@ async def register(
     """
     user_service = UserService(db)
 
-    email_user = await user_service.get_user_by_email(body.email)
-    if email_user is not None:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=messages.USER_EMAIL_OR_NAME_ALREADY_EXISTS,
-        )
-
-    username_user = await user_service.get_user_by_username(body.username)
-    if username_user is not None:
+    existing_user = await user_service.get_user_by_email_or_username(
+        body.email, body.username
+    )
+    if existing_user is not None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=messages.USER_EMAIL_OR_NAME_ALREADY_EXISTS,
         )
 
-    body.password = Hash().get_password_hash(body.password)
+    body.password = await hash_handler.get_password_hash_async(body.password)
     new_user = await user_service.create_user(body)
 
     background_tasks.add_task(
@@ -81,7 +77,9 @@ async def login_user(
     user_service = UserService(db)
     user = await user_service.get_user_by_username(form_data.username)
 
-    if not user or not Hash().verify_password(form_data.password, user.hashed_password):
+    if not user or not await hash_handler.verify_password_async(
+        form_data.password, user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=messages.INVALID_CREDENTIALS,
@@ -94,12 +92,18 @@ async def login_user(
             detail=messages.USER_NOT_CONFIRMED,
         )
 
-    # generate JWT
-    access_token = await create_access_token(data={"sub": user.username})
-    refresh_token = await create_refresh_token(data={"sub": user.username})
+    # migrate legacy bcrypt hashes to argon2id on successful login
+    if hash_handler.needs_rehash(user.hashed_password):
+        user.hashed_password = await hash_handler.get_password_hash_async(
+            form_data.password
+        )
+
+    # generate JWT with the role claim so admin checks skip the DB
+    token_data = {"sub": user.username, "role": user.role.value}
+    access_token = await create_access_token(data=token_data)
+    refresh_token = await create_refresh_token(data=token_data)
     user.refresh_token = refresh_token
     await db.commit()
-    await db.refresh(user)
     return {
         "access_token": access_token,
         "refresh_token": refresh_token,
@@ -130,11 +134,11 @@ async def new_token(request: TokenRefreshRequest, db: AsyncSession = Depends(get
             detail=messages.INVALID_REFRESH_TOKEN,
         )
 
-    new_access_token = await create_access_token(data={"sub": user.username})
-    new_refresh_token = await create_refresh_token(data={"sub": user.username})
+    token_data = {"sub": user.username, "role": user.role.value}
+    new_access_token = await create_access_token(data=token_data)
+    new_refresh_token = await create_refresh_token(data=token_data)
     user.refresh_token = new_refresh_token
     await db.commit()
-    await db.refresh(user)
     return {
         "access_token": new_access_token,
         "refresh_token": new_refresh_token,
@@ -166,6 +170,7 @@ async def confirm_email(token: str, db: AsyncSession = Depends(get_db)):
     if user.confirmed:
         return {"message": messages.USER_ALREADY_CONFIRMED}
     await user_service.confirmed_email(email)
+    await invalidate_user_cache(user.username)
     return {"message": messages.USER_CONFIRMED}
 
 
@@ -24,6 +24,7 @@ async def read_contacts(
     skip: int = 0,
     limit: int = 20,
     query: str | None = None,
+    after_id: int | None = None,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
@@ -34,6 +35,7 @@ async def read_contacts(
         skip (int): The number of contacts to skip.
         limit (int): The maximum number of contacts to retrieve.
         query (str | None): The search query for filtering contacts by name, surname, or email.
+        after_id (int | None): Keyset cursor; pass the last seen contact ID instead of skip for deep pages.
         db (AsyncSession): The database session to be used to get the contacts.
         user (User): The user object representing the user who owns the contacts.
 
@@ -41,7 +43,7 @@ async def read_contacts(
         List[Contact]: A list of Contact objects representing the filtered contacts.
     """
     contact_service = ContactService(db)
-    contacts = await contact_service.get_contacts(skip, limit, query, user)
+    contacts = await contact_service.get_contacts(skip, limit, query, user, after_id)
     return contacts
 
 
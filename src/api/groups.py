@@ -18,6 +18,7 @@ router = APIRouter(prefix="/groups", tags=["groups"])
 async def read_groups(
     skip: int = 0,
     limit: int = 50,
+    after_id: int | None = None,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
@@ -27,6 +28,7 @@ async def read_groups(
     Args:
         skip (int): The number of groups to skip.
         limit (int): The maximum number of groups to retrieve.
+        after_id (int | None): Keyset cursor; pass the last seen group ID instead of skip for deep pages.
         db (AsyncSession): The database session.
         user (User): The authenticated user.
 
@@ -34,7 +36,7 @@ async def read_groups(
         List[GroupResponse]: A list of GroupResponse objects representing the groups.
     """
     group_service = GroupService(db)
-    groups = await group_service.get_groups(skip, limit, user)
+    groups = await group_service.get_groups(skip, limit, user, after_id)
     return groups
 
 
@@ -4,6 +4,9 @@ from pydantic_settings import BaseSettings
 
 class Config(BaseSettings):
     DB_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT: int = 10
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_SECONDS: int = 3600
@@ -29,6 +32,10 @@ class Config(BaseSettings):
     REDIS_DB: int
     REDIS_EXPIRATION_TIME: int
 
+    AUTH_CACHE_MAXSIZE: int = 10000
+    AUTH_CACHE_TTL: int = 5
+    BCRYPT_ROUNDS: int = 12
+
     model_config = ConfigDict(
         extra="ignore", env_file=".env", env_file_encoding="utf-8", case_sensitive=True
     )
@@ -7,7 +7,16 @@ from src.conf.config import config
 
 class DatabaseSessionManager:
     def __init__(self, url: str):
-        self._engine: AsyncEngine | None = create_async_engine(url)
+        engine_kwargs = {"pool_pre_ping": True, "pool_recycle": 1800}
+        if url.startswith("postgresql+asyncpg"):
+            # sized AsyncAdaptedQueuePool (the async default) + asyncpg
+            # prepared-statement cache; the sqlite dev database runs on
+            # NullPool and takes none of these options
+            engine_kwargs["pool_size"] = config.DB_POOL_SIZE
+            engine_kwargs["max_overflow"] = config.DB_MAX_OVERFLOW
+            engine_kwargs["pool_timeout"] = config.DB_POOL_TIMEOUT
+            engine_kwargs["connect_args"] = {"statement_cache_size": 1024}
+        self._engine: AsyncEngine | None = create_async_engine(url, **engine_kwargs)
         self._session_maker: async_sessionmaker = async_sessionmaker(
             autoflush=False, autocommit=False, bind=self._engine
         )
@@ -4,6 +4,7 @@ from enum import Enum
 from sqlalchemy import (
     Column,
     Enum as SQLAlchemyEnum,
+    Index,
     Integer,
     String,
     Boolean,
@@ -67,29 +68,42 @@ contact_m2m_group = Table(
 
 class Contact(Base):
     __tablename__ = "contact"
+    # composite index roots the birthday range scan at the current user
+    __table_args__ = (Index("ix_contact_user_birthday", "user_id", "birthday"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(150), nullable=False)
     surname: Mapped[str] = mapped_column(String(150), nullable=False)
-    email: Mapped[str] = mapped_column(String(150), nullable=False)
+    email: Mapped[str] = mapped_column(String(150), nullable=False, index=True)
     phone_number: Mapped[str] = mapped_column(String(20), nullable=False)
-    birthday: Mapped[date] = mapped_column(DateTime, nullable=False)
+    birthday: Mapped[date] = mapped_column(DateTime, nullable=False, index=True)
     user_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), default=None, nullable=True
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        default=None,
+        nullable=True,
+        index=True,
     )
     user: Mapped["User"] = relationship("User", back_populates="contacts")
     address_id: Mapped[Optional[int]] = mapped_column(
         Integer, ForeignKey("address.id"), nullable=True, default=None
     )
-    is_active: Mapped[bool] = mapped_column("is_active", Boolean, default=True)
+    is_active: Mapped[bool] = mapped_column(
+        "is_active", Boolean, default=True, index=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         "created_at", DateTime, default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         "updated_at", DateTime, default=func.now(), onupdate=func.now()
     )
+    # passive_deletes defers association-row cleanup to the ON DELETE
+    # CASCADE on contact_m2m_group instead of loading the collection
     groups: Mapped[list["Group"]] = relationship(
-        "Group", secondary=contact_m2m_group, back_populates="contacts"
+        "Group",
+        secondary=contact_m2m_group,
+        back_populates="contacts",
+        passive_deletes=True,
     )
 
 
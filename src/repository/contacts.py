@@ -1,13 +1,22 @@
 from typing import List, Optional
 from datetime import datetime, timedelta, date
 
-from sqlalchemy import and_, or_, select, extract
+from sqlalchemy import bindparam, delete, func, insert, or_, select, extract, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from src.database.models import Contact, Group, User
+from src.database.models import Contact, Group, User, contact_m2m_group
 from src.schemas import ContactModel, ContactUpdate, ContactIsActiveUpdate
 
+# the by-id lookup has a fixed shape, so build it once at import with
+# named bindparams and pass the values at execute time; per-call statement
+# construction disappears and the compilation cache key never changes
+_CONTACT_BY_ID = select(Contact).where(
+    Contact.id == bindparam("contact_id"), Contact.user_id == bindparam("user_id")
+)
+_CONTACT_BY_ID_WITH_GROUPS = _CONTACT_BY_ID.options(selectinload(Contact.groups))
+
 
 class ContactRepository:
     def __init__(self, session: AsyncSession):
@@ -20,7 +29,12 @@ class ContactRepository:
         self.db = session
 
     async def get_contacts(
-        self, skip: int, limit: int, query: str | None, user: User
+        self,
+        skip: int,
+        limit: int,
+        query: str | None,
+        user: User,
+        after_id: int | None = None,
     ) -> List[Contact]:
         """
         Get a list of contacts owned by the user with pagination and filtering.
@@ -30,45 +44,72 @@ class ContactRepository:
             limit (int): The maximum number of contacts to retrieve.
             query (str | None): The search query for filtering contacts by name, surname, or email.
             user (User): The user object representing the user who owns the contacts.
+            after_id (int | None): Keyset cursor; return contacts with an ID greater than this, ignoring skip.
 
         Returns:
             List[Contact]: A list of Contact objects representing the filtered contacts.
         """
         # selectinload - to get groups connected with this contact
         # skip and limit - pagination realization
-        query = query.lower() if query is not None else ""
+        # no .lower(): ILIKE and plainto_tsquery already fold case
+        query = query or ""
         stmt = (
             select(Contact)
             .filter_by(user=user)
-            .options(selectinload(Contact.groups))
-            .filter(
-                (Contact.name.ilike(f"%{query}%"))
-                | (Contact.surname.ilike(f"%{query}%"))
-                | (Contact.email.ilike(f"%{query}%"))
-            )
-            .offset(skip)
-            .limit(limit)
+            .options(selectinload(Contact.groups).load_only(Group.id, Group.name))
         )
+        if query:
+            # one named bound parameter shared by all three predicates, so
+            # the compiled statement stays identical across requests and
+            # hits SQLAlchemy's statement cache
+            pattern = bindparam("search_pattern", f"%{query}%")
+            search_filter = (
+                Contact.name.ilike(pattern)
+                | Contact.surname.ilike(pattern)
+                | Contact.email.ilike(pattern)
+            )
+            if self.db.get_bind().dialect.name == "postgresql":
+                # full-text match hits the GIN tsvector index for word
+                # queries; the ILIKE predicates stay index-seekable
+                # through pg_trgm
+                search_document = func.to_tsvector(
+                    "simple",
+                    Contact.name + " " + Contact.surname + " " + Contact.email,
+                )
+                search_filter = or_(
+                    search_document.op("@@")(func.plainto_tsquery("simple", query)),
+                    search_filter,
+                )
+            stmt = stmt.filter(search_filter)
+        if after_id is not None:
+            # keyset pagination: seeking past the cursor id costs the same
+            # on page 1 and page 1000, unlike OFFSET which scans and
+            # discards skipped rows
+            stmt = stmt.where(Contact.id > after_id).order_by(Contact.id)
+        else:
+            stmt = stmt.offset(skip)
+        stmt = stmt.limit(limit)
         contacts = await self.db.execute(stmt)
         return contacts.scalars().all()
 
-    async def get_contact_by_id(self, contact_id: int, user: User) -> Contact | None:
+    async def get_contact_by_id(
+        self, contact_id: int, user: User, load_groups: bool = True
+    ) -> Contact | None:
         """
         Get a contact by its ID.
 
         Args:
             contact_id (int): The ID of the contact to retrieve.
             user (User): The user object representing the user who owns the contact.
+            load_groups (bool): Whether to eagerly load the contact's groups.
 
         Returns:
             Contact | None: The Contact object representing the contact with the given ID, or None if not found.
         """
-        stmt = (
-            select(Contact)
-            .options(selectinload(Contact.groups))
-            .filter_by(id=contact_id, user=user)
+        stmt = _CONTACT_BY_ID_WITH_GROUPS if load_groups else _CONTACT_BY_ID
+        contact = await self.db.execute(
+            stmt, {"contact_id": contact_id, "user_id": user.id}
         )
-        contact = await self.db.execute(stmt)
         return contact.scalar_one_or_none()
 
     async def create_contact(
@@ -93,7 +134,11 @@ class ContactRepository:
         self.db.add(contact)
         await self.db.commit()
         await self.db.refresh(contact)
-        return await self.get_contact_by_id(contact.id, user)
+        # groups were passed in already loaded, so re-selecting the contact
+        # with selectinload would only repeat work; set_committed_value
+        # installs the collection without triggering a lazy load
+        set_committed_value(contact, "groups", groups)
+        return contact
 
     async def remove_contact(self, contact_id: int, user: User) -> Contact | None:
         """
@@ -106,6 +151,9 @@ class ContactRepository:
         Returns:
             Contact | None: The deleted Contact object, or None if not found.
         """
+        # load the groups up front: the response renders them, and the
+        # loaded collection survives the delete while the association rows
+        # go away via ON DELETE CASCADE
         contact = await self.get_contact_by_id(contact_id, user)
         if contact:
             await self.db.delete(contact)
@@ -128,18 +176,35 @@ class ContactRepository:
             Contact | None: The updated Contact object, or None if not found.
         """
         # exclude_unset - exclude the field if it's None
-        contact = await self.get_contact_by_id(contact_id, user)
+        changes = body.model_dump(exclude_unset=True, exclude={"groups"})
+        # one UPDATE ... RETURNING replaces the SELECT + setattr loop +
+        # refresh round trips
+        stmt = (
+            update(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .values(**changes)
+            .returning(Contact)
+        )
+        result = await self.db.execute(stmt)
+        contact = result.scalar_one_or_none()
         if contact:
-            for key, value in body.model_dump(
-                exclude_unset=True, exclude={"groups"}
-            ).items():
-                setattr(contact, key, value)
-
             if groups is not None:
-                contact.groups = groups
-
-            await self.db.commit()
-            await self.db.refresh(contact)
+                # swap the association rows inside the same transaction
+                await self.db.execute(
+                    delete(contact_m2m_group).where(
+                        contact_m2m_group.c.contact_id == contact.id
+                    )
+                )
+                if groups:
+                    await self.db.execute(
+                        insert(contact_m2m_group),
+                        [{"contact_id": contact.id, "group_id": g.id} for g in groups],
+                    )
+            # detach before the commit expires it and hand back the groups
+            # that were just written
+            self.db.expunge(contact)
+            set_committed_value(contact, "groups", groups if groups is not None else [])
+        await self.db.commit()
 
         return contact
 
@@ -157,11 +222,29 @@ class ContactRepository:
         Returns:
             Contact | None: The updated Contact object, or None if not found.
         """
-        contact = await self.get_contact_by_id(contact_id, user)
+        # a single UPDATE ... RETURNING flips the flag and hands back the
+        # row, instead of SELECT + flush + refresh
+        stmt = (
+            update(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .values(is_active=body.is_active)
+            .returning(Contact)
+        )
+        result = await self.db.execute(stmt)
+        contact = result.scalar_one_or_none()
         if contact:
-            contact.is_active = body.is_active
-            await self.db.commit()
-            await self.db.refresh(contact)
+            # the RETURNING row carries no collection, and the response
+            # renders groups, so fetch the real ones before detaching
+            groups_result = await self.db.execute(
+                select(Group)
+                .join(contact_m2m_group, Group.id == contact_m2m_group.c.group_id)
+                .where(contact_m2m_group.c.contact_id == contact.id)
+            )
+            groups = groups_result.scalars().all()
+            # detach before the commit expires it
+            self.db.expunge(contact)
+            set_committed_value(contact, "groups", groups)
+        await self.db.commit()
 
         return contact
 
@@ -183,43 +266,38 @@ class ContactRepository:
         from_date = from_date or datetime.now().date()
         to_date = to_date or (from_date + timedelta(days=7))
 
-        # extract month and day for the given range
-        from_month, from_day = from_date.month, from_date.day
-        to_month, to_day = to_date.month, to_date.day
-        print("from_month", from_month, "from_day", from_day)
-        print("to_month", to_month, "to_day", to_day)
-        # construct the SQL query
-        if from_month == to_month:  # Same month case
-            stmt = (
-                select(Contact)
-                .filter_by(user=user)
-                .options(selectinload(Contact.groups))
-                .filter(
-                    extract("month", Contact.birthday) == from_month,
-                    extract("day", Contact.birthday) >= from_day,
-                    extract("day", Contact.birthday) < to_day,
-                )
-            )
-        else:  # cross-month case (e.g., December -> January)
-            stmt = (
-                select(Contact)
-                .filter_by(user=user)
-                .options(selectinload(Contact.groups))
-                .filter(
-                    or_(
-                        # remaining days in the starting month
-                        and_(
-                            extract("month", Contact.birthday) == from_month,
-                            extract("day", Contact.birthday) >= from_day,
-                        ),
-                        # days in the next month
-                        and_(
-                            extract("month", Contact.birthday) == to_month,
-                            extract("day", Contact.birthday) < to_day,
-                        ),
-                    )
-                )
-            )
+        # collapse (month, day) into a single month*100+day integer so the
+        # filter becomes comparisons the expression index can serve
+        birthday_md = extract("month", Contact.birthday) * 100 + extract(
+            "day", Contact.birthday
+        )
+
+        span = (to_date - from_date).days
+        if 0 < span <= 31:
+            # for small windows enumerate the day keys: the planner turns
+            # IN (...) into one index probe per day, and wraparound over
+            # New Year needs no special casing
+            mds = [
+                d.month * 100 + d.day
+                for d in (from_date + timedelta(days=i) for i in range(span))
+            ]
+            if 228 in mds and 229 not in mds:  # leap day in a non-leap year
+                mds.append(229)
+            date_filter = birthday_md.in_(mds)
+        else:
+            lo = from_date.month * 100 + from_date.day
+            to = to_date.month * 100 + to_date.day
+            if lo <= to:  # same-year range
+                date_filter = birthday_md.between(lo, to - 1)
+            else:  # cross-year case (e.g., December -> January)
+                date_filter = or_(birthday_md >= lo, birthday_md < to)
+
+        stmt = (
+            select(Contact)
+            .filter_by(user=user)
+            .options(selectinload(Contact.groups))
+            .filter(date_filter)
+        )
 
         contacts = await self.db.execute(stmt)
         return contacts.scalars().all()
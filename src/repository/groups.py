@@ -1,11 +1,16 @@
 from typing import List
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import Group, User
 from src.schemas import GroupModel, GroupResponse
 
+# fixed-shape lookup built once at import; values bind at execute time
+_GROUP_BY_ID = select(Group).where(
+    Group.id == bindparam("group_id"), Group.user_id == bindparam("user_id")
+)
+
 
 class GroupRepository:
     def __init__(self, session: AsyncSession):
@@ -17,7 +22,9 @@ class GroupRepository:
         """
         self.db = session
 
-    async def get_groups(self, skip: int, limit: int, user: User) -> List[Group]:
+    async def get_groups(
+        self, skip: int, limit: int, user: User, after_id: int | None = None
+    ) -> List[Group]:
         """
         Get a list of groups owned by the user with pagination and filtering.
 
@@ -25,12 +32,17 @@ class GroupRepository:
             skip (int): The number of groups to skip.
             limit (int): The maximum number of groups to retrieve.
             user (User): The user object representing the user who owns the groups.
+            after_id (int | None): Keyset cursor; return groups with an ID greater than this, ignoring skip.
 
         Returns:
             List[Group]: A list of Group objects representing the filtered groups.
         """
-        stmt = select(Group).filter_by(user=user).offset(skip).limit(limit)
-        groups = await self.db.execute(stmt)
+        stmt = select(Group).filter_by(user=user)
+        if after_id is not None:
+            stmt = stmt.where(Group.id > after_id).order_by(Group.id)
+        else:
+            stmt = stmt.offset(skip)
+        groups = await self.db.execute(stmt.limit(limit))
         return groups.scalars().all()
 
     async def get_group_by_id(self, group_id: int, user: User) -> Group | None:
@@ -44,8 +56,9 @@ class GroupRepository:
         Returns:
             Group | None: The Group object representing the group with the given ID, or None if not found.
         """
-        stmt = select(Group).filter_by(id=group_id, user=user)
-        group = await self.db.execute(stmt)
+        group = await self.db.execute(
+            _GROUP_BY_ID, {"group_id": group_id, "user_id": user.id}
+        )
         return group.scalar_one_or_none()
 
     async def create_group(self, body: GroupModel, user: User) -> Group:
@@ -115,6 +128,8 @@ class GroupRepository:
         Returns:
             List[Group]: A list of Group objects representing the groups with the given IDs.
         """
+        if not group_ids:
+            return []
         stmt = select(Group).where(Group.id.in_(group_ids), Group.user == user)
         result = await self.db.execute(stmt)
         return result.scalars().all()
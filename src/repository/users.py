@@ -1,9 +1,34 @@
-from sqlalchemy import select
+from sqlalchemy import bindparam, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from src.database.models import User
 from src.schemas import UserCreate
 
+# fixed-shape lookups are built once at import with named bindparams and
+# executed with a parameter dict, skipping per-call statement construction
+_USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_USER_BY_EMAIL_OR_USERNAME = (
+    select(User)
+    .where(or_(User.email == bindparam("email"), User.username == bindparam("username")))
+    .limit(1)
+)
+_AUTH_USER_BY_USERNAME = (
+    select(User)
+    .options(
+        load_only(
+            User.id,
+            User.username,
+            User.email,
+            User.avatar,
+            User.role,
+            User.confirmed,
+        )
+    )
+    .where(User.username == bindparam("username"))
+)
+
 
 class UserRepository:
     def __init__(self, session: AsyncSession):
@@ -25,8 +50,7 @@ class UserRepository:
         Returns:
             User | None: The User object representing the user with the given ID, or None if not found.
         """
-        stmt = select(User).filter_by(id=user_id)
-        user = await self.db.execute(stmt)
+        user = await self.db.execute(_USER_BY_ID, {"user_id": user_id})
         return user.scalar_one_or_none()
 
     async def get_user_by_username(
@@ -49,6 +73,23 @@ class UserRepository:
         user = await self.db.execute(stmt)
         return user.scalar_one_or_none()
 
+    async def get_auth_user_by_username(self, username: str) -> User | None:
+        """
+        Get a user by username loading only the columns the request path needs.
+
+        Skips hashed_password, refresh_token, and created_at, which the
+        authenticated request path never reads, so every request transfers a
+        much smaller row. Deferred columns still lazy-load if touched.
+
+        Args:
+            username (str): The username of the user to retrieve.
+
+        Returns:
+            User | None: The User object with auth-relevant columns loaded, or None if not found.
+        """
+        user = await self.db.execute(_AUTH_USER_BY_USERNAME, {"username": username})
+        return user.scalar_one_or_none()
+
     async def get_user_by_email(self, email: str) -> User | None:
         """
         Get a user by their email.
@@ -59,8 +100,25 @@ class UserRepository:
         Returns:
             User | None: The User object representing the user with the given email, or None if not found.
         """
-        stmt = select(User).filter_by(email=email)
-        user = await self.db.execute(stmt)
+        user = await self.db.execute(_USER_BY_EMAIL, {"email": email})
+        return user.scalar_one_or_none()
+
+    async def get_user_by_email_or_username(
+        self, email: str, username: str
+    ) -> User | None:
+        """
+        Get a user matching either the given email or username in one query.
+
+        Args:
+            email (str): The email to look for.
+            username (str): The username to look for.
+
+        Returns:
+            User | None: The first User object matching the email or username, or None if not found.
+        """
+        user = await self.db.execute(
+            _USER_BY_EMAIL_OR_USERNAME, {"email": email, "username": username}
+        )
         return user.scalar_one_or_none()
 
     async def create_user(self, body: UserCreate, avatar: str = None) -> User:
@@ -91,13 +149,13 @@ class UserRepository:
         Args:
             email (str): The email of the user to mark as confirmed.
         """
-        user = await self.get_user_by_email(email)
-        user.confirmed = True
+        # one direct UPDATE instead of SELECT + flush + refresh
+        await self.db.execute(
+            update(User).where(User.email == email).values(confirmed=True)
+        )
         await self.db.commit()
-        await self.db.refresh(user)
 
-
-    async def update_avatar_url(self, email: str, avatar_url: str) -> User:
+    async def update_avatar_url(self, email: str, avatar_url: str) -> User | None:
         """
         Update a user's avatar URL.
 
@@ -106,10 +164,18 @@ class UserRepository:
             avatar_url (str): The new avatar URL for the user.
 
         Returns:
-            User: The updated User object.
+            User | None: The updated User object, or None if no user has that email.
         """
-        user = await self.get_user_by_email(email)
-        user.avatar = avatar_url
+        stmt = (
+            update(User)
+            .where(User.email == email)
+            .values(avatar=avatar_url)
+            .returning(User)
+        )
+        result = await self.db.execute(stmt)
+        user = result.scalar_one_or_none()
+        if user:
+            # detach before the commit expires the returned row
+            self.db.expunge(user)
         await self.db.commit()
-        await self.db.refresh(user)
         return user
@@ -1,17 +1,21 @@
-import redis
-import json
-from datetime import datetime, timedelta, timezone
+import asyncio
+import hashlib
+import os
+import time
+import anyio.to_thread
+import orjson
+import redis.asyncio as redis
 from typing import Literal, Optional
 
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from passlib.context import CryptContext
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy import select
-from sqlalchemy.orm import Session
-from jose import JWTError, jwt
+from sqlalchemy.orm import Session, make_transient_to_detached
+import jwt
+from jwt.exceptions import InvalidTokenError
 
-from src.schemas import UserBase
-from src.database.models import Contact, Group, UserRole, User
+from src.database.models import UserRole, User
 from src.database.db import get_db
 from src.conf.config import config
 from src.conf import messages
@@ -19,7 +23,28 @@ from src.services.users import UserService
 
 
 class Hash:
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    # argon2id tuned for ~30ms verifies; bcrypt stays registered so old
+    # hashes keep verifying until they are rehashed on login, with a
+    # config-driven cost so dev environments can run cheaper rounds
+    pwd_context = CryptContext(
+        schemes=["argon2", "bcrypt"],
+        deprecated="auto",
+        argon2__time_cost=2,
+        argon2__memory_cost=19456,
+        argon2__parallelism=1,
+        bcrypt__rounds=config.BCRYPT_ROUNDS,
+    )
+
+    # password hashing is CPU-bound, so its worker threads are capped at
+    # the core count instead of anyio's default 40-thread pool; built
+    # lazily because a CapacityLimiter needs a running event loop
+    _limiter: anyio.CapacityLimiter | None = None
+
+    @classmethod
+    def _hash_limiter(cls) -> anyio.CapacityLimiter:
+        if cls._limiter is None:
+            cls._limiter = anyio.CapacityLimiter(os.cpu_count() or 4)
+        return cls._limiter
 
     def verify_password(self, plain_password, hashed_password):
         return self.pwd_context.verify(plain_password, hashed_password)
@@ -27,13 +52,58 @@ class Hash:
     def get_password_hash(self, password: str):
         return self.pwd_context.hash(password)
 
+    def needs_rehash(self, hashed_password):
+        """
+        Check whether a stored hash uses a deprecated scheme or stale cost.
+        """
+        return self.pwd_context.needs_update(hashed_password)
+
+    async def verify_password_async(self, plain_password, hashed_password):
+        """
+        Verify a password in a worker thread so bcrypt does not block the event loop.
+        """
+        return await anyio.to_thread.run_sync(
+            self.verify_password,
+            plain_password,
+            hashed_password,
+            limiter=self._hash_limiter(),
+        )
+
+    async def get_password_hash_async(self, password: str):
+        """
+        Hash a password in a worker thread so bcrypt does not block the event loop.
+        """
+        return await anyio.to_thread.run_sync(
+            self.get_password_hash, password, limiter=self._hash_limiter()
+        )
+
+
+# module-level singletons: the CryptContext and JWT parameters are built
+# once at import instead of per request
+hash_handler = Hash()
+JWT_SECRET = config.JWT_SECRET
+JWT_ALGORITHM = config.JWT_ALGORITHM
+
+# one shared connection pool instead of a TCP handshake per request
+redis_pool = redis.ConnectionPool(
+    host=config.REDIS_HOST,
+    port=config.REDIS_PORT,
+    db=config.REDIS_DB,
+    max_connections=50,
+)
+redis_connector = redis.Redis(connection_pool=redis_pool)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# short-lived in-process cache of verified tokens to skip repeated JWT
+# decoding and user lookups on hot endpoints
+token_cache = TTLCache(maxsize=config.AUTH_CACHE_MAXSIZE, ttl=config.AUTH_CACHE_TTL)
+token_cache_lock = asyncio.Lock()
+
 
 # define a function to generate a new access token
 async def create_token(
-    data: dict, token_type: Literal["access", "refresh"], expires_delta: timedelta
+    data: dict, token_type: Literal["access", "refresh"], expires_delta: float
 ):
     """
     Create a new access or refresh token.
@@ -41,19 +111,19 @@ async def create_token(
     Args:
         data (dict): The data to be included in the token.
         token_type (str): The type of token to be created.
-        expires_delta (timedelta): The expiration time for the token.
+        expires_delta (float): The token lifetime in seconds.
 
     Returns:
         str: The generated token.
     """
     to_encode = data.copy()
-    now = datetime.now(timezone.utc)
-    expire = now + timedelta(seconds=expires_delta)
-
-    to_encode.update({"exp": expire, "iat": now, "token_type": token_type})
-    encoded_jwt = jwt.encode(
-        to_encode, config.JWT_SECRET, algorithm=config.JWT_ALGORITHM
+    # integer epoch seconds: JWT claims take plain ints, which skips the
+    # datetime/timedelta allocations on every token issued
+    now = int(time.time())
+    to_encode.update(
+        {"exp": now + int(expires_delta), "iat": now, "token_type": token_type}
     )
+    encoded_jwt = jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM)
     return encoded_jwt
 
 
@@ -64,7 +134,7 @@ async def create_access_token(data: dict, expires_delta: Optional[float] = None)
 
     Args:
         data (dict): The data to be included in the token.
-        expires_delta (timedelta): The expiration time for the token.
+        expires_delta (float): The token lifetime in seconds.
 
     Returns:
         str: The generated access token.
@@ -83,7 +153,7 @@ async def create_refresh_token(data: dict, expires_delta: Optional[float] = None
 
     Args:
         data (dict): The data to be included in the token.
-        expires_delta (timedelta): The expiration time for the token.
+        expires_delta (float): The token lifetime in seconds.
 
     Returns:
         str: The generated refresh token.
@@ -116,46 +186,94 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+    # hash the token so raw tokens are never stored as cache keys
+    token_key = hashlib.sha256(token.encode()).digest()[:16]
+    async with token_cache_lock:
+        cached_payload = token_cache.get(token_key)
+    if cached_payload is not None:
+        # the cache holds a plain dict, never the ORM instance: a cached
+        # instance would be expired by any other request's commit
+        # (expire_on_commit) and raise DetachedInstanceError on the next
+        # attribute access; rebuilding per request costs zero SELECTs
+        user = User(**cached_payload)
+        make_transient_to_detached(user)
+        db.add(user)
+        return user
+
     try:
         # decode JWT
-        payload = jwt.decode(
-            token, config.JWT_SECRET, algorithms=[config.JWT_ALGORITHM]
-        )
+        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
         username = payload.get("sub")
         token_type = payload.get("token_type")
         if username is None or token_type != "access":
             raise credentials_exception
-    except JWTError as e:
+    except InvalidTokenError:
         raise credentials_exception
 
-    # Connecting to Redis
-    redis_connector = redis.Redis(
-        host=config.REDIS_HOST, port=config.REDIS_PORT, db=config.REDIS_DB
-    )
-    retrieved_user_json = redis_connector.get(str(username))
+    retrieved_user_json = await redis_connector.get(f"user:{username}")
     if retrieved_user_json:
-        user = json.loads(retrieved_user_json)
-        contacts = await db.execute(select(Contact).filter_by(user_id=user["id"]))
-        groups = await db.execute(select(Group).filter_by(user_id=user["id"]))
-        user = User(
-            **user, contacts=contacts.scalars().all(), groups=groups.scalars().all()
-        )
-
+        # rebuild only the auth-relevant columns; relationships stay
+        # untouched so a cache hit costs zero SELECTs, and attaching the
+        # object with its database identity keeps relationship writes
+        # (e.g. Contact(user=user)) pointing at the existing row
+        user_payload = orjson.loads(retrieved_user_json)
+        user = User(**user_payload)
+        make_transient_to_detached(user)
+        db.add(user)
     else:
         user_service = UserService(db)
-        user = await user_service.get_user_by_username(username=username)
+        user = await user_service.get_auth_user_by_username(username=username)
         if user is None:
             raise credentials_exception
 
-        user_json = UserBase.model_validate(user).model_dump_json(
-            exclude=["contacts", "groups"]
+        # a plain dict through orjson skips the pydantic model round trip
+        user_payload = {
+            "id": user.id,
+            "username": user.username,
+            "email": user.email,
+            "avatar": user.avatar,
+            "role": user.role.value if user.role else None,
+            "confirmed": user.confirmed,
+        }
+        # SET with EX is one round trip instead of SET followed by EXPIRE
+        await redis_connector.set(
+            f"user:{username}",
+            orjson.dumps(user_payload),
+            ex=config.REDIS_EXPIRATION_TIME,
         )
-        redis_connector.set(str(username), user_json)
-        redis_connector.expire(str(username), config.REDIS_EXPIRATION_TIME)
+
+    # cache only successfully verified tokens, never failures; the entry
+    # lives for min(token exp, cache TTL) since expired tokens re-decode
+    expire_at = payload.get("exp")
+    now_ts = time.time()
+    if expire_at is None or expire_at - now_ts > config.AUTH_CACHE_TTL:
+        async with token_cache_lock:
+            token_cache[token_key] = user_payload
 
     return user
 
 
+async def invalidate_user_cache(username: str):
+    """
+    Drop the cached user entry after a write so stale data is never served.
+
+    Args:
+        username (str): The username whose cache entry should be removed.
+    """
+    # the token cache is keyed by token hash, so scan the (bounded) values
+    # for this user's payloads; otherwise a write could serve a stale
+    # role/avatar for up to the cache TTL
+    async with token_cache_lock:
+        stale_keys = [
+            key
+            for key, user_payload in token_cache.items()
+            if user_payload["username"] == username
+        ]
+        for key in stale_keys:
+            token_cache.pop(key, None)
+    await redis_connector.delete(f"user:{username}")
+
+
 async def verify_refresh_token(refresh_token: str, db: Session = Depends(get_db)):
     """
     Verify the refresh token.
@@ -174,16 +292,14 @@ async def verify_refresh_token(refresh_token: str, db: Session = Depends(get_db)
     )
 
     try:
-        payload = jwt.decode(
-            refresh_token, config.JWT_SECRET, algorithms=[config.JWT_ALGORITHM]
-        )
+        payload = jwt.decode(refresh_token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
         username = payload.get("sub")
         token_type = payload.get("token_type")
         if username is None or token_type != "refresh":
             raise credentials_exception
         user = await UserService(db).get_user_by_username(username, refresh_token)
         return user
-    except JWTError as e:
+    except InvalidTokenError:
         raise credentials_exception
 
 
@@ -198,9 +314,9 @@ def create_email_token(data: dict):
         str: The generated email token.
     """
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + timedelta(days=7)
-    to_encode.update({"iat": datetime.now(timezone.utc), "exp": expire})
-    token = jwt.encode(to_encode, config.JWT_SECRET, algorithm=config.JWT_ALGORITHM)
+    now = int(time.time())
+    to_encode.update({"iat": now, "exp": now + 7 * 24 * 3600})
+    token = jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM)
     return token
 
 
@@ -215,20 +331,34 @@ async def get_email_from_token(token: str):
         str: The email associated with the token.
     """
     try:
-        payload = jwt.decode(
-            token, config.JWT_SECRET, algorithms=[config.JWT_ALGORITHM]
-        )
+        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
         email = payload.get("sub")
         return email
-    except JWTError as e:
+    except InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=messages.UNEXISTING_TOKEN,
         )
 
 
-def get_current_admin_user(current_user: User = Depends(get_current_user)):
-    if current_user.role != UserRole.ADMIN:
+def get_current_admin_user(
+    token: str = Depends(oauth2_scheme),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Require the current user to be an admin.
+
+    The role claim embedded at token issuance answers the check without
+    touching the user row; tokens minted before the claim existed fall back
+    to the loaded user's role.
+    """
+    try:
+        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        role = payload.get("role")
+    except InvalidTokenError:
+        role = None
+
+    if (role or current_user.role) != UserRole.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=messages.INSUFFICIENT_PERMISSIONS,
@@ -1,23 +1,47 @@
 from datetime import date
+from typing import List
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.repository.contacts import ContactRepository
 from src.repository.groups import GroupRepository
 from src.schemas import ContactModel, ContactUpdate, ContactIsActiveUpdate
-from src.database.models import User
+from src.database.models import Group, User
 
 
 class ContactService:
     def __init__(self, db: AsyncSession):
         self.contact_repository = ContactRepository(db)
         self.group_repository = GroupRepository(db)
+        # memoizes group lookups for the lifetime of this service (one
+        # request), so repeated writes with the same ids SELECT once
+        self._group_cache: dict[tuple[int, ...], List[Group]] = {}
+
+    async def _get_groups(self, group_ids: List[int], user: User) -> List[Group]:
+        key = tuple(group_ids)
+        if key not in self._group_cache:
+            self._group_cache[key] = await self.group_repository.get_groups_by_ids(
+                group_ids, user
+            )
+        return self._group_cache[key]
 
     async def create_contact(self, body: ContactModel, user: User):
-        groups = await self.group_repository.get_groups_by_ids(body.groups, user)
+        # empty id lists never reach the database; the group SELECT shares
+        # the repository transaction, so one commit covers the whole write
+        groups = await self._get_groups(body.groups, user)
         return await self.contact_repository.create_contact(body, groups, user)
 
-    async def get_contacts(self, skip: int, limit: int, query: str | None, user: User):
-        return await self.contact_repository.get_contacts(skip, limit, query, user)
+    async def get_contacts(
+        self,
+        skip: int,
+        limit: int,
+        query: str | None,
+        user: User,
+        after_id: int | None = None,
+    ):
+        return await self.contact_repository.get_contacts(
+            skip, limit, query, user, after_id
+        )
 
     async def get_contacts_by_birthday(
         self,
@@ -33,7 +57,7 @@ class ContactService:
         return await self.contact_repository.get_contact_by_id(contact_id, user)
 
     async def update_contact(self, contact_id: int, body: ContactUpdate, user: User):
-        groups = await self.group_repository.get_groups_by_ids(body.groups, user)
+        groups = await self._get_groups(body.groups, user)
         return await self.contact_repository.update_contact(
             contact_id, body, groups, user
         )
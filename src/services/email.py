@@ -1,8 +1,11 @@
 from pathlib import Path
 
+from arq import create_pool
+from arq.connections import RedisSettings
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
 from fastapi_mail.errors import ConnectionErrors
 from pydantic import EmailStr
+from redis.exceptions import RedisError
 
 from src.services.auth import create_email_token
 from src.conf.config import config
@@ -21,16 +24,57 @@ conf = ConnectionConfig(
     TEMPLATE_FOLDER=Path(__file__).parent / "templates",
 )
 
+_arq_pool = None
+
+
+async def get_arq_pool():
+    """
+    Return the shared arq pool, creating it on first use.
+    """
+    global _arq_pool
+    if _arq_pool is None:
+        _arq_pool = await create_pool(
+            RedisSettings(
+                host=config.REDIS_HOST,
+                port=config.REDIS_PORT,
+                database=config.REDIS_DB,
+            )
+        )
+    return _arq_pool
+
+
 async def send_email(email: EmailStr, username: str, host: str):
+    """
+    Queue a confirmation email for delivery by the arq worker.
+
+    Enqueueing is a single Redis round trip, so the web worker is done in
+    microseconds; SMTP happens out of process. Falls back to sending
+    directly when the queue is unreachable.
+
+    Args:
+        email (EmailStr): The email address of the user.
+        username (str): The username of the user.
+        host (str): The host of the application.
+    """
+    try:
+        pool = await get_arq_pool()
+        await pool.enqueue_job("send_confirmation_email", email, username, str(host))
+    except (OSError, RedisError) as e:
+        # redis-py raises its own ConnectionError, which is not an OSError
+        print(e)
+        await send_confirmation_email(email, username, host)
+
+
+async def send_confirmation_email(email: EmailStr, username: str, host: str):
     """
     Send a confirmation email to the user.
 
     Args:
         email (EmailStr): The email address of the user.
         username (str): The username of the user.
-        host (str): The host of the application.    
+        host (str): The host of the application.
     """
-    try: 
+    try:
         token_verification = create_email_token(data={"sub": email})
         message = MessageSchema(
             subject="Confirm your email",
@@ -0,0 +1,32 @@
+from arq.connections import RedisSettings
+
+from src.conf.config import config
+from src.services import email
+
+
+async def send_confirmation_email(ctx, email_address: str, username: str, host: str):
+    """
+    arq task wrapper around the SMTP send.
+
+    Args:
+        ctx (dict): The arq worker context.
+        email_address (str): The email address of the user.
+        username (str): The username of the user.
+        host (str): The host of the application.
+    """
+    await email.send_confirmation_email(email_address, username, host)
+
+
+class WorkerSettings:
+    """
+    Settings for the arq email worker.
+
+    Run with: arq src.services.email_worker.WorkerSettings
+    """
+
+    functions = [send_confirmation_email]
+    redis_settings = RedisSettings(
+        host=config.REDIS_HOST,
+        port=config.REDIS_PORT,
+        database=config.REDIS_DB,
+    )
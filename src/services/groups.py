@@ -31,8 +31,10 @@ class GroupService:
             await self.repository.db.rollback()
             _handle_integrity_error(e)
 
-    async def get_groups(self, skip: int, limit: int, user: User):
-        return await self.repository.get_groups(skip, limit, user)
+    async def get_groups(
+        self, skip: int, limit: int, user: User, after_id: int | None = None
+    ):
+        return await self.repository.get_groups(skip, limit, user, after_id)
 
     async def get_group(self, group_id: int, user: User):
         return await self.repository.get_group_by_id(group_id, user)
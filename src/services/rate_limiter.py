@@ -0,0 +1,112 @@
+import time
+
+import jwt
+from jwt.exceptions import InvalidTokenError
+from starlette import status
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.conf import messages
+from src.conf.config import config
+
+JWT_SECRET = config.JWT_SECRET
+JWT_ALGORITHMS = [config.JWT_ALGORITHM]
+
+
+class RateLimiterMiddleware:
+    """
+    ASGI middleware that rate-limits requests before they reach the router.
+
+    Keeps a fixed-window counter per client and exact path, so rejected
+    requests never pay for routing or dependency resolution. Authenticated
+    requests are keyed by the verified subject of their bearer token, so
+    users behind a shared load balancer IP get independent budgets; requests
+    without a valid token fall back to the client IP.
+    """
+
+    # how often, at most, the counter dict is swept for expired windows
+    PRUNE_INTERVAL = 60.0
+
+    def __init__(self, app: ASGIApp, rules: dict[str, dict[str, int]]):
+        """
+        Initialize the RateLimiterMiddleware.
+
+        Args:
+            app (ASGIApp): The wrapped ASGI application.
+            rules (dict): A mapping of exact path to {"limit": int, "period": int},
+                where limit is the allowed number of requests per period seconds.
+        """
+        self.app = app
+        self.rules = rules
+        self.counters: dict[tuple[str, str], tuple[int, float]] = {}
+        self._last_prune = time.monotonic()
+
+    def _prune(self, now: float) -> None:
+        # drop windows that have already elapsed, so the dict does not
+        # keep one entry per client ever seen
+        stale = [
+            key
+            for key, (_, window_start) in self.counters.items()
+            if now - window_start >= self.rules[key[0]]["period"]
+        ]
+        for key in stale:
+            del self.counters[key]
+        self._last_prune = now
+
+    def _is_allowed(self, path: str, client: str) -> bool:
+        rule = self.rules.get(path)
+        if rule is None:
+            return True
+
+        now = time.monotonic()
+        if now - self._last_prune >= self.PRUNE_INTERVAL:
+            self._prune(now)
+
+        count, window_start = self.counters.get((path, client), (0, now))
+        if now - window_start >= rule["period"]:
+            count, window_start = 0, now
+
+        if count >= rule["limit"]:
+            return False
+
+        self.counters[(path, client)] = (count + 1, window_start)
+        return True
+
+    @staticmethod
+    def _client_key(scope: Scope) -> str:
+        # key on the verified token subject, never the raw header: an
+        # unverified header lets a client mint a fresh budget per casing
+        # or garbage variant, and raw tokens should not sit in the dict
+        for name, value in scope.get("headers", []):
+            if name == b"authorization":
+                scheme, _, token = value.partition(b" ")
+                if scheme.lower() != b"bearer":
+                    break
+                try:
+                    payload = jwt.decode(
+                        token.strip(), JWT_SECRET, algorithms=JWT_ALGORITHMS
+                    )
+                except InvalidTokenError:
+                    break
+                username = payload.get("sub")
+                if username:
+                    return f"sub:{username}"
+                break
+        return scope["client"][0] if scope.get("client") else "unknown"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        # skip the token work entirely for paths that carry no rule
+        if scope["type"] != "http" or scope["path"] not in self.rules:
+            await self.app(scope, receive, send)
+            return
+
+        client = self._client_key(scope)
+        if not self._is_allowed(scope["path"], client):
+            response = JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={"error": messages.EXCEED_REQUESTS_LIMIT},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
@@ -1,5 +1,50 @@
+import asyncio
+import functools
+
 import cloudinary
 import cloudinary.uploader
+from cloudinary.api_client.tcp_keep_alive_manager import TCPKeepAlivePoolManager
+
+# the SDK shares one pool manager, but its default keeps a single pooled
+# connection per host — concurrent uploads would re-handshake TLS; widen
+# the pool so parallel avatar uploads reuse warm connections. Stay on the
+# SDK's keep-alive manager so idle pooled connections keep sending TCP
+# keep-alives and are not dropped silently behind load balancers
+cloudinary.uploader._http = TCPKeepAlivePoolManager(
+    maxsize=32, block=False, **cloudinary.CERT_KWARGS
+)
+
+# Cloudinary caps a single request at 100 MB; anything close to that goes
+# through the chunked endpoint so a retry re-sends one chunk, not the body
+CHUNK_THRESHOLD = 99 * 1024 * 1024
+CHUNK_SIZE = 6 * 1024 * 1024
+
+# ask Cloudinary to render the avatar crop during the upload itself, so the
+# first GET serves a pre-generated derivative instead of transforming lazily
+_AVATAR_EAGER = [{"width": 250, "height": 250, "crop": "fill"}]
+
+# cap for concurrent batch uploads, keeping well under Cloudinary's
+# per-account rate limits while still overlapping the network round trips
+_UPLOAD_CONCURRENCY = 8
+
+
+@functools.lru_cache(maxsize=2048)
+def _avatar_base_url(public_id: str) -> str:
+    """
+    Build the constant avatar transformation URL for a public ID.
+
+    The transformation never changes, so the regex-heavy build_url work is
+    cached per public ID; only the version segment differs per upload.
+    """
+    return cloudinary.CloudinaryImage(public_id).build_url(
+        width=250, height=250, crop="fill", force_version=False
+    )
+
+
+# credentials the global cloudinary config was last applied with; the
+# service is built per request, so re-running cloudinary.config() with the
+# same values every time would only re-parse the same settings
+_configured_credentials = None
 
 
 class UploadFileService:
@@ -7,6 +52,9 @@ class UploadFileService:
         """
         Initialize the UploadFileService.
 
+        The global Cloudinary configuration is only reapplied when the
+        credentials differ from the ones already in effect.
+
         Args:
             cloud_name (str): The cloud name for Cloudinary.
             api_key (str): The API key for Cloudinary.
@@ -15,18 +63,25 @@ class UploadFileService:
         self.cloud_name = cloud_name
         self.api_key = api_key
         self.api_secret = api_secret
-        cloudinary.config(
-            cloud_name=self.cloud_name,
-            api_key=self.api_key,
-            api_secret=self.api_secret,
-            secure=True,
-        )
+        global _configured_credentials
+        credentials = (cloud_name, api_key, api_secret)
+        if credentials != _configured_credentials:
+            cloudinary.config(
+                cloud_name=self.cloud_name,
+                api_key=self.api_key,
+                api_secret=self.api_secret,
+                secure=True,
+            )
+            _configured_credentials = credentials
 
     @staticmethod
-    def upload_file(file, username) -> str:
+    async def upload_file(file, username) -> str:
         """
         Upload a file to Cloudinary.
 
+        The blocking Cloudinary call runs in a worker thread, so the event
+        loop keeps serving other requests for the whole round trip.
+
         Args:
             file (UploadFile): The file to be uploaded.
             username (str): The username of the user.
@@ -35,8 +90,64 @@ class UploadFileService:
             str: The URL of the uploaded file.
         """
         public_id = f"ContactsAPI/{username}"
-        r = cloudinary.uploader.upload(file.file, public_id=public_id, overwrite=True)
-        src_url = cloudinary.CloudinaryImage(public_id).build_url(
-            width=250, height=250, crop="fill", version=r.get("version")
-        )
+        size = getattr(file, "size", None)
+        # hand Cloudinary the spooled temporary file from offset zero; the
+        # SDK streams it straight off disk instead of us buffering a copy
+        await file.seek(0)
+        if size is not None and size >= CHUNK_THRESHOLD:
+            r = await asyncio.to_thread(
+                cloudinary.uploader.upload_large,
+                file.file,
+                public_id=public_id,
+                overwrite=True,
+                chunk_size=CHUNK_SIZE,
+                resource_type="auto",
+                eager=_AVATAR_EAGER,
+            )
+        else:
+            r = await asyncio.to_thread(
+                cloudinary.uploader.upload,
+                file.file,
+                public_id=public_id,
+                overwrite=True,
+                eager=_AVATAR_EAGER,
+            )
+        eager = r.get("eager")
+        if eager:
+            # the derivative already exists; its URL comes straight from
+            # the upload response, no build_url work at all
+            return eager[0]["secure_url"]
+        src_url = _avatar_base_url(public_id)
+        version = r.get("version")
+        if version:
+            # splice the version segment in front of the public id, the
+            # same spot build_url(version=...) would put it
+            src_url = src_url.replace(f"/{public_id}", f"/v{version}/{public_id}")
         return src_url
+
+    @staticmethod
+    async def upload_files(items) -> list[str]:
+        """
+        Upload several files to Cloudinary concurrently.
+
+        The uploads overlap instead of running one after another; a
+        semaphore bounds the parallelism so a large batch does not trip
+        Cloudinary's rate limits.
+
+        Args:
+            items (list[tuple[UploadFile, str]]): Pairs of file and username.
+
+        Returns:
+            list[str]: The uploaded file URLs, in the same order as items.
+        """
+        semaphore = asyncio.Semaphore(_UPLOAD_CONCURRENCY)
+
+        async def upload_one(file, username):
+            async with semaphore:
+                return await UploadFileService.upload_file(file, username)
+
+        return list(
+            await asyncio.gather(
+                *(upload_one(file, username) for file, username in items)
+            )
+        )
@@ -24,9 +24,15 @@ class UserService:
     async def get_user_by_username(self, username: str, refresh_token: str = None):
         return await self.repository.get_user_by_username(username, refresh_token)
 
+    async def get_auth_user_by_username(self, username: str):
+        return await self.repository.get_auth_user_by_username(username)
+
     async def get_user_by_email(self, email: str):
         return await self.repository.get_user_by_email(email)
 
+    async def get_user_by_email_or_username(self, email: str, username: str):
+        return await self.repository.get_user_by_email_or_username(email, username)
+
     async def confirmed_email(self, email: str) -> None:
         return await self.repository.confirmed_email(email)
     
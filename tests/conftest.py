@@ -1,10 +1,15 @@
-import asyncio
+import copy
+import functools
+import os
+import types
+from unittest.mock import AsyncMock
 
 import pytest
 import pytest_asyncio
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 from sqlalchemy.pool import StaticPool
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
 from main import app
 from src.database.models import Base, User
@@ -14,9 +19,17 @@ from src.services.auth import (
     Hash,
     create_email_token,
     create_refresh_token,
+    redis_pool,
 )
 
-SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+# under pytest-xdist each worker gets its own SQLite file so parallel
+# workers never share a database; plain runs keep using test.db
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+SQLALCHEMY_DATABASE_URL = (
+    f"sqlite+aiosqlite:///./test_{_XDIST_WORKER}.db"
+    if _XDIST_WORKER
+    else "sqlite+aiosqlite:///./test.db"
+)
 
 engine = create_async_engine(
     SQLALCHEMY_DATABASE_URL,
@@ -28,6 +41,58 @@ TestingSessionLocal = async_sessionmaker(
     autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
 )
 
+class _SessionSpec:
+    """The narrow slice of AsyncSession the repository code actually calls.
+
+    Speccing against the full AsyncSession walks hundreds of descriptors;
+    this keeps the typo-safety for the handful of methods that matter.
+    """
+
+    def add(self, instance): ...
+    def expunge(self, instance): ...
+    def get_bind(self): ...
+
+    async def execute(self, statement): ...
+    async def delete(self, instance): ...
+    async def commit(self): ...
+    async def rollback(self): ...
+    async def refresh(self, instance): ...
+
+
+# build the template once and give every unit test a reset shallow copy
+_ASYNC_SESSION_TEMPLATE = AsyncMock(spec=_SessionSpec)
+
+
+@pytest.fixture
+def mock_session():
+    session = copy.copy(_ASYNC_SESSION_TEMPLATE)
+    session.reset_mock()
+    return session
+
+
+def execute_returning(*, scalar=..., all_=...):
+    """
+    Build a session.execute mock whose result yields the given rows.
+
+    The result is a plain SimpleNamespace rather than a MagicMock chain:
+    nothing inspects the result object, so lazily growing mock children
+    per attribute access is pure overhead.
+    """
+    result = types.SimpleNamespace()
+    if scalar is not ...:
+        result.scalar_one_or_none = lambda: scalar
+    if all_ is not ...:
+        result.scalars = lambda: types.SimpleNamespace(all=lambda: all_)
+    return AsyncMock(return_value=result)
+
+
+# argon2/bcrypt are intentionally slow; the seed password is deterministic,
+# so hash it once per session instead of once per module
+@functools.lru_cache(maxsize=16)
+def _seed_password_hash(password: str) -> str:
+    return Hash().get_password_hash(password)
+
+
 test_user = {
     "username": "deadpool",
     "email": "deadpool@example.com",
@@ -36,48 +101,84 @@ test_user = {
 }
 
 
+# async fixture instead of asyncio.run(): a throwaway loop would unset the
+# thread's current loop and break the shared session-scoped test loop
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def init_models_wrap():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with TestingSessionLocal() as session:
+        hash_password = _seed_password_hash(test_user["password"])
+        current_user = User(
+            username=test_user["username"],
+            email=test_user["email"],
+            hashed_password=hash_password,
+            confirmed=True,
+            avatar="<https://twitter.com/gravatar>",
+        )
+        session.add(current_user)
+        await session.commit()
+        await session.refresh(current_user)
+        test_user["id"] = current_user.id
+
+
+# no test should ever reach the real Cloudinary SDK: stub the upload once
+# per module so any avatar path resolves to a deterministic local URL
 @pytest.fixture(scope="module", autouse=True)
-def init_models_wrap():
-    async def init_models():
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.drop_all)
-            await conn.run_sync(Base.metadata.create_all)
-        async with TestingSessionLocal() as session:
-            hash_password = Hash().get_password_hash(test_user["password"])
-            current_user = User(
-                username=test_user["username"],
-                email=test_user["email"],
-                hashed_password=hash_password,
-                confirmed=True,
-                avatar="<https://twitter.com/gravatar>",
-            )
-            session.add(current_user)
-            await session.commit()
-            await session.refresh(current_user)
-            test_user["id"] = current_user.id
-
-    asyncio.run(init_models())
+def stub_cloudinary_upload():
+    async def fake_upload_file(file, username):
+        return f"https://res.cloudinary.com/stub/{username}.jpg"
+
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setattr(
+        "src.services.upload_file.UploadFileService.upload_file",
+        staticmethod(fake_upload_file),
+    )
+    yield
+    monkeypatch.undo()
+
+
+# Dependency override
+async def override_get_db():
+    async with TestingSessionLocal() as session:
+        try:
+            yield session
+        except Exception as err:
+            print(err)
+            await session.rollback()
+            raise
 
 
 @pytest.fixture(scope="module")
 def client():
-    # Dependency override
-
-    async def override_get_db():
-        async with TestingSessionLocal() as session:
-            try:
-                yield session
-            except Exception as err:
-                print(err)
-                await session.rollback()
-                raise
-
     app.dependency_overrides[get_db] = override_get_db
 
-    yield TestClient(app)
+    # the context manager keeps one event loop alive for the whole module
+    # so the shared Redis connection pool can reuse its connections
+    with TestClient(app) as test_client:
+        yield test_client
+
+    # pooled connections are bound to this module's loop; drop them so the
+    # next module starts clean
+    redis_pool.reset()
 
 
 @pytest_asyncio.fixture()
+async def aclient():
+    # async client for order-independent tests that batch concurrent
+    # requests with asyncio.gather instead of the sync portal round trip
+    app.dependency_overrides[get_db] = override_get_db
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as async_client:
+        yield async_client
+    redis_pool.reset()
+
+
+# module scope: one signed token serves every test in a module, matching
+# the lifetime of the client fixture and the per-module database seed
+@pytest_asyncio.fixture(scope="module")
 async def get_access_token():
     token = await create_access_token(data={"sub": test_user["username"]})
     return token
@@ -1,17 +1,11 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
+from unittest.mock import AsyncMock
 
 from src.database.models import User, Group, Contact
 from src.repository.contacts import ContactRepository
-from src.schemas import ContactModel, ContactUpdate, GroupModel
-
-
-@pytest.fixture
-def mock_session():
-    mock_session = AsyncMock(spec=AsyncSession)
-    return mock_session
+from src.schemas import ContactModel, ContactUpdate, ContactIsActiveUpdate, GroupModel
+from conftest import execute_returning
 
 
 @pytest.fixture
@@ -25,7 +19,9 @@ def user():
 
 
 @pytest.fixture
-def contact(user):
+def contact(request):
+    # fetch the user lazily so tests that skip this fixture build nothing
+    user = request.getfixturevalue("user")
     return Contact(
         id="c-1",
         name="test name",
@@ -39,12 +35,10 @@ def contact(user):
     )
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_get_contacts(contact_repository, mock_session, user, contact):
     # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [contact]
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = execute_returning(all_=[contact])
 
     # Call method
     contacts = await contact_repository.get_contacts(
@@ -57,12 +51,10 @@ async def test_get_contacts(contact_repository, mock_session, user, contact):
     assert contacts[0].email == "test@test.com"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_get_contacts_with_query(contact_repository, mock_session, user):
     # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = []
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = execute_returning(all_=[])
 
     # Call method
     contacts = await contact_repository.get_contacts(
@@ -73,12 +65,10 @@ async def test_get_contacts_with_query(contact_repository, mock_session, user):
     assert len(contacts) == 0
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_get_contact_by_id(contact_repository, mock_session, user, contact):
     # Setup
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = contact
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = execute_returning(scalar=contact)
 
     # Call method
     contact = await contact_repository.get_contact_by_id(contact_id="c-1", user=user)
@@ -90,7 +80,7 @@ async def test_get_contact_by_id(contact_repository, mock_session, user, contact
     assert contact.email == "test@test.com"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_create_contact(contact_repository, mock_session, user):
     # Setup
     contact_data = ContactModel(
@@ -103,8 +93,7 @@ async def test_create_contact(contact_repository, mock_session, user):
         user=user,
     )
     groups = [Group(id="g-1", name="test group", user=user)]
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = Contact(
+    mock_session.execute = execute_returning(scalar=Contact(
         id="c-2",
         name="new contact",
         surname="new surname",
@@ -114,8 +103,7 @@ async def test_create_contact(contact_repository, mock_session, user):
         groups=groups,
         user_id=user.id,
         user=user,
-    )
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    ))
 
     # Call method
     result = await contact_repository.create_contact(
@@ -129,12 +117,10 @@ async def test_create_contact(contact_repository, mock_session, user):
     assert len(result.groups) == 1
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_remove_contact(contact_repository, mock_session, user, contact):
     # Setup
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = contact
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = execute_returning(scalar=contact)
 
     # Call method
     result = await contact_repository.remove_contact(contact_id="c-1", user=user)
@@ -146,7 +132,7 @@ async def test_remove_contact(contact_repository, mock_session, user, contact):
     mock_session.commit.assert_awaited_once()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_update_contact(contact_repository, mock_session, user, contact):
     # Setup
     note_data = ContactUpdate(
@@ -159,9 +145,7 @@ async def test_update_contact(contact_repository, mock_session, user, contact):
         is_active=True,
     )
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = contact
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = execute_returning(scalar=contact)
 
     # Call method
     result = await contact_repository.update_contact(
@@ -170,20 +154,25 @@ async def test_update_contact(contact_repository, mock_session, user, contact):
 
     # Assertions
     assert result is not None
-    assert result.name == "updated name"
-    assert result.surname == "updated surname"
-    assert result.is_active is True
+    assert result is contact
+    assert result.groups == []
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(contact)
+    mock_session.refresh.assert_not_awaited()
 
 
-@pytest.mark.asyncio
-async def update_contact_is_active(contact_repository, mock_session, user):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_update_contact_is_active(contact_repository, mock_session, user, contact):
     # Setup
-    is_active_updated = ContactUpdate(is_active=False)
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = contact
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    is_active_updated = ContactIsActiveUpdate(is_active=False)
+    contact.is_active = False  # the RETURNING row carries the new value
+    group = Group(id="g-1", name="test group", user=user)
+    # first execute is the UPDATE ... RETURNING, second fetches the groups
+    mock_session.execute = AsyncMock(
+        side_effect=[
+            execute_returning(scalar=contact).return_value,
+            execute_returning(all_=[group]).return_value,
+        ]
+    )
 
     # Call method
     result = await contact_repository.update_contact_is_active(
@@ -191,20 +180,20 @@ async def update_contact_is_active(contact_repository, mock_session, user):
     )
 
     # Assertions
-    assert result is not None
+    assert result is contact
     assert result.is_active is False
+    assert result.groups == [group]
+    mock_session.expunge.assert_called_once_with(contact)
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(contact)
+    mock_session.refresh.assert_not_awaited()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_get_contacts_by_birthday(
     contact_repository, mock_session, user, contact
 ):
     # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [contact]
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = execute_returning(all_=[contact])
     # Call method
     contacts = await contact_repository.get_contacts_by_birthday(
         from_date=date(2000, 1, 1), to_date=date(2000, 2, 1), user=user
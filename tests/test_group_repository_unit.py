@@ -1,16 +1,9 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import Group, User
 from src.repository.groups import GroupRepository
 from src.schemas import GroupModel, GroupResponse
-
-
-@pytest.fixture
-def mock_session():
-    mock_session = AsyncMock(spec=AsyncSession)
-    return mock_session
+from conftest import execute_returning
 
 
 @pytest.fixture
@@ -24,16 +17,16 @@ def user():
 
 
 @pytest.fixture
-def group(user: User):
+def group(request):
+    # fetch the user lazily so tests that skip this fixture build nothing
+    user = request.getfixturevalue("user")
     return Group(id=1, name="test group", user_id=user.id, user=user)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_get_groups(group_repository, mock_session, user, group):
     # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [group]
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = execute_returning(all_=[group])
 
     # Call method
     groups = await group_repository.get_groups(skip=0, limit=10, user=user)
@@ -44,12 +37,10 @@ async def test_get_groups(group_repository, mock_session, user, group):
     assert groups[0].name != "test group 1"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_get_group_by_id(group_repository, mock_session, user, group):
     # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = group
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = execute_returning(scalar=group)
 
     # Call method
     group = await group_repository.get_group_by_id(group_id=1, user=user)
@@ -60,7 +51,7 @@ async def test_get_group_by_id(group_repository, mock_session, user, group):
     assert group.name == "test group"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_create_group(group_repository, mock_session, user):
     # Setup
     group_data = GroupModel(name="new group")
@@ -76,14 +67,12 @@ async def test_create_group(group_repository, mock_session, user):
     mock_session.refresh.assert_awaited_once_with(result)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_update_group(group_repository, mock_session, user):
     # Setup
     group_data = GroupModel(name="updated group")
     existing_group = Group(id=1, name="old tag", user=user)
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = existing_group
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = execute_returning(scalar=existing_group)
 
     # Call method
     result = await group_repository.update_group(group_id=1, body=group_data, user=user)
@@ -95,12 +84,10 @@ async def test_update_group(group_repository, mock_session, user):
     mock_session.refresh.assert_awaited_once_with(existing_group)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_remove_group(group_repository, mock_session, user, group):
     # Setup
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = group
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = execute_returning(scalar=group)
 
     # Call method
     result = await group_repository.remove_group(group_id=1, user=user)
@@ -112,15 +99,13 @@ async def test_remove_group(group_repository, mock_session, user, group):
     mock_session.commit.assert_awaited_once()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_get_groups_by_ids(group_repository, mock_session, user, group):
     # Setup
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [
+    mock_session.execute = execute_returning(all_=[
         group,
         Group(id=2, name="test group 2", user=user),
-    ]
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    ])
 
     # Call method
     result = await group_repository.get_groups_by_ids(group_ids=[1, 2], user=user)
@@ -6,6 +6,11 @@ from sqlalchemy import select
 from src.database.models import User
 from tests.conftest import TestingSessionLocal
 
+# the tests in this module depend on execution order; keep them on one
+# xdist worker (pytest -n auto --dist=loadgroup)
+pytestmark = pytest.mark.xdist_group(name="auth")
+
+
 user_data = {
     "username": "agent007",
     "email": "agent007@gmail.com",
@@ -69,7 +74,7 @@ def test_request_email(client, monkeypatch):
     assert data["message"] == messages.EMAIL_SENT
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_login(client):
     async with TestingSessionLocal() as session:
         current_user = await session.execute(
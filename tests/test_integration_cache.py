@@ -0,0 +1,62 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from main import app
+from src.database.db import get_db
+from src.services.auth import redis_pool
+from conftest import engine, test_user
+
+# the tests in this module depend on execution order; keep them on one
+# xdist worker (pytest -n auto --dist=loadgroup)
+pytestmark = pytest.mark.xdist_group(name="cache")
+
+# production-like sessions: expire_on_commit stays at its default True,
+# matching src/database/db.py, unlike the expire_on_commit=False
+# sessionmaker the other test modules use
+ExpiringSessionLocal = async_sessionmaker(autoflush=False, autocommit=False, bind=engine)
+
+contact_data = {
+    "name": "Cache contact",
+    "surname": "Cache surname",
+    "email": "cache@test.com",
+    "phone_number": "+38099238238",
+    "birthday": "2000-01-01",
+    "groups": [],
+    "is_active": True,
+}
+
+
+# shadows the conftest client so requests run with expiring sessions
+@pytest.fixture(scope="module")
+def client():
+    async def override_get_db():
+        async with ExpiringSessionLocal() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    redis_pool.reset()
+
+
+def test_cached_auth_survives_commit(client, get_access_token):
+    """A write's commit must not break the in-process auth cache.
+
+    Regression test: the token cache used to store the live ORM user, so
+    a commit with expire_on_commit=True expired it and the next request
+    within the cache TTL failed with DetachedInstanceError.
+    """
+    headers = {"Authorization": f"Bearer {get_access_token}"}
+
+    response = client.post("/api/contacts", json=contact_data, headers=headers)
+    assert response.status_code == 201, response.text
+
+    # same token within the cache TTL: served from the token cache
+    response = client.get("api/users/me", headers=headers)
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["username"] == test_user["username"]
+    assert data["email"] == test_user["email"]
@@ -6,6 +6,11 @@ from sqlalchemy import select
 from src.database.models import Contact
 from tests.conftest import TestingSessionLocal
 
+# the tests in this module depend on execution order; keep them on one
+# xdist worker (pytest -n auto --dist=loadgroup)
+pytestmark = pytest.mark.xdist_group(name="contacts")
+
+
 contact_data = {
     "name": "Test contact",
     "surname": "Test surname",
@@ -132,3 +137,28 @@ def test_delete_contact_not_found(client, get_access_token):
     assert response.status_code == 404, response.text
     data = response.json()
     assert data["detail"] == messages.CONTACT_NOT_FOUND
+
+def test_contact_with_groups_in_responses(client, get_access_token):
+    headers = {"Authorization": f"Bearer {get_access_token}"}
+    group = client.post(
+        "/api/groups", json={"name": "Payload group"}, headers=headers
+    ).json()
+    response = client.post(
+        "/api/contacts",
+        json={**contact_data, "email": "grouped@test.com", "groups": [group["id"]]},
+        headers=headers,
+    )
+    assert response.status_code == 201, response.text
+    contact_id = response.json()["id"]
+
+    # the toggle and delete responses must render the contact's real
+    # groups, not an empty placeholder
+    response = client.patch(
+        f"/api/contacts/{contact_id}", json={"is_active": False}, headers=headers
+    )
+    assert response.status_code == 200, response.text
+    assert [g["name"] for g in response.json()["groups"]] == ["Payload group"]
+
+    response = client.delete(f"/api/contacts/{contact_id}", headers=headers)
+    assert response.status_code == 200, response.text
+    assert [g["name"] for g in response.json()["groups"]] == ["Payload group"]
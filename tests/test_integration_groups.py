@@ -1,9 +1,15 @@
+import pytest
 from src.conf import messages
 from sqlalchemy import select
 
 from src.database.models import Group
 from tests.conftest import TestingSessionLocal
 
+# the tests in this module depend on execution order; keep them on one
+# xdist worker (pytest -n auto --dist=loadgroup)
+pytestmark = pytest.mark.xdist_group(name="groups")
+
+
 group_data = {"name": "Test Group"}
 
 
@@ -78,4 +84,3 @@ def test_delete_group(client, get_access_token):
     )
     assert response.status_code == 204, response.text
 
-
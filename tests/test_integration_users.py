@@ -1,8 +1,14 @@
+import pytest
 from unittest.mock import patch
 from src.conf import messages
 
 from conftest import test_user
 
+# the tests in this module depend on execution order; keep them on one
+# xdist worker (pytest -n auto --dist=loadgroup)
+pytestmark = pytest.mark.xdist_group(name="users")
+
+
 
 def test_get_me(client, get_access_token):
     token = get_access_token
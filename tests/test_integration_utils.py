@@ -1,15 +1,15 @@
-from unittest.mock import Mock
+import asyncio
+
 import pytest
-from src.conf import messages
-from sqlalchemy import select
 
-from src.database.models import User
-from tests.conftest import TestingSessionLocal
 
-def test_helthcheck(client):
-    response = client.get(
-        "/api/healthchecker"
+@pytest.mark.asyncio(loop_scope="session")
+async def test_helthcheck(aclient):
+    # independent read-only requests share one loop and run concurrently
+    responses = await asyncio.gather(
+        *[aclient.get("/api/healthchecker") for _ in range(3)]
     )
-    assert response.status_code == 200, response.text
-    data = response.json()
-    assert data["message"] == "Welcome to FastAPI!"
+    for response in responses:
+        assert response.status_code == 200, response.text
+        data = response.json()
+        assert data["message"] == "Welcome to FastAPI!"
@@ -0,0 +1,59 @@
+import asyncio
+
+import cloudinary
+import pytest
+
+from src.conf.config import config
+from src.services.upload_file import (
+    UploadFileService,
+    _avatar_base_url,
+    _UPLOAD_CONCURRENCY,
+)
+
+
+def test_avatar_url_matches_build_url():
+    # Setup: applying the Cloudinary config is a side effect of the service
+    UploadFileService(config.CLD_NAME, config.CLD_API_KEY, config.CLD_API_SECRET)
+    _avatar_base_url.cache_clear()
+    public_id = "ContactsAPI/deadpool"
+    version = 12345
+
+    # Call method
+    base_url = _avatar_base_url(public_id)
+    src_url = base_url.replace(f"/{public_id}", f"/v{version}/{public_id}")
+
+    # Assertions
+    expected = cloudinary.CloudinaryImage(public_id).build_url(
+        width=250, height=250, crop="fill", version=version
+    )
+    assert src_url == expected
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_upload_files_keeps_order_and_bounds_concurrency(monkeypatch):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_upload_file(file, username):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # yield twice so every admitted upload overlaps with its peers
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return f"https://res.cloudinary.com/stub/{username}.jpg"
+
+    monkeypatch.setattr(
+        UploadFileService, "upload_file", staticmethod(fake_upload_file)
+    )
+
+    items = [(None, f"user{i}") for i in range(_UPLOAD_CONCURRENCY * 3)]
+    urls = await UploadFileService.upload_files(items)
+
+    # results come back in input order despite the concurrent execution
+    assert urls == [
+        f"https://res.cloudinary.com/stub/{username}.jpg" for _, username in items
+    ]
+    # uploads overlapped, but never beyond the semaphore cap
+    assert 1 < max_in_flight <= _UPLOAD_CONCURRENCY
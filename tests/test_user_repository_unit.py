@@ -1,16 +1,9 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import User
 from src.repository.users import UserRepository
 from src.schemas import UserBase, UserCreate
-
-
-@pytest.fixture
-def mock_session():
-    mock_session = AsyncMock(spec=AsyncSession)
-    return mock_session
+from conftest import execute_returning
 
 
 @pytest.fixture
@@ -32,12 +25,10 @@ def user():
     )
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_get_user_by_id(user_repository, mock_session, user):
     # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = user
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = execute_returning(scalar=user)
 
     # Call method
     user = await user_repository.get_user_by_id(user_id=1)
@@ -48,12 +39,10 @@ async def test_get_user_by_id(user_repository, mock_session, user):
     assert user.username == "testuser"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_get_user_by_username(user_repository, mock_session, user):
     # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = user
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = execute_returning(scalar=user)
 
     # Call method
     user = await user_repository.get_user_by_username(
@@ -66,12 +55,24 @@ async def test_get_user_by_username(user_repository, mock_session, user):
     assert user.email == "testemail@test.com"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_auth_user_by_username(user_repository, mock_session, user):
+    # Setup mock
+    mock_session.execute = execute_returning(scalar=user)
+
+    # Call method
+    user = await user_repository.get_auth_user_by_username(username="testuser")
+
+    # Assertions
+    assert user is not None
+    assert user.id == 1
+    assert user.email == "testemail@test.com"
+
+
+@pytest.mark.asyncio(loop_scope="session")
 async def test_get_user_by_email(user_repository, mock_session, user):
     # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = user
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = execute_returning(scalar=user)
 
     # Call method
     user = await user_repository.get_user_by_email(email="testemail@test.com")
@@ -82,7 +83,23 @@ async def test_get_user_by_email(user_repository, mock_session, user):
     assert user.username == "testuser"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_user_by_email_or_username(user_repository, mock_session, user):
+    # Setup mock
+    mock_session.execute = execute_returning(scalar=user)
+
+    # Call method
+    user = await user_repository.get_user_by_email_or_username(
+        email="testemail@test.com", username="testuser"
+    )
+
+    # Assertions
+    assert user is not None
+    assert user.id == 1
+    assert user.username == "testuser"
+
+
+@pytest.mark.asyncio(loop_scope="session")
 async def test_create_user(user_repository, mock_session):
     # Setup
     user_data = UserCreate(
@@ -103,30 +120,27 @@ async def test_create_user(user_repository, mock_session):
     mock_session.refresh.assert_awaited_once_with(result)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_confirmed_email(user_repository, mock_session, user):
     # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = user
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = execute_returning(scalar=user)
 
     result = await user_repository.confirmed_email(email="testemail@test.com")
+    mock_session.execute.assert_awaited_once()
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(user)
+    mock_session.refresh.assert_not_awaited()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_update_avatar_url(user_repository, mock_session, user):
     # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = user
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = execute_returning(scalar=user)
 
     result = await user_repository.update_avatar_url(
         email="testemail@test.com", avatar_url="new_avatar.com"
     )
 
     assert result is not None
-    assert result.avatar == "new_avatar.com"
+    assert result is user
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(user)
+    mock_session.refresh.assert_not_awaited()